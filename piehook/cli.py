@@ -1,8 +1,11 @@
-import argparse
-import sys
-import os
+_TEMPLATE = """from piehook.hooks import hooks
+
+
+@hooks.add("my_hook")
+def my_hook():
+    print("Hello from my_hook!")
+"""
 
-from piehook.hooks import hooks
 
 class Command:
     def __init__(self, name, help):
@@ -17,36 +20,32 @@ class Command:
 
 
 class CreateCommand(Command):
-    def add_arguments(self, parser: argparse.ArgumentParser):
+    def add_arguments(self, parser):
         parser.add_argument("name", type=str, help="The name of the hooks file to create (without suffix).")
         parser.add_argument("-d", "--directory", help="The directory to create the hooks file in.")
         parser.add_argument("-v", "--verbose", action="store_true", help="Print verbose output.")
 
     def handle(self, args):
+        import os
+
         abs_path = os.path.abspath(args.directory or os.getcwd())
         self._create_hooks_file(abs_path, args.name)
 
     def _create_hooks_file(self, dir, name):
-        if not '_hooks' in name:
+        import os
+
+        if name.endswith(".py"):
+            name = name[:-3]
+
+        if not name.endswith('_hooks'):
             name += '_hooks'
-        
-        if not name.endswith(".py"):
-            name += ".py"
-        
-        if not os.path.exists(dir):
-            os.makedirs(dir)
 
-        full_path = os.path.join(dir, name)
+        os.makedirs(dir, exist_ok=True)
+
+        full_path = os.path.join(dir, name + ".py")
 
         with open(full_path, 'w') as f:
-            f.write("""
-from piehook.hooks import hooks 
-                    
-@hooks.add("my_hook")
-def my_hook():
-    print("Hello from my_hook!")
-                    """
-                    )
+            f.write(_TEMPLATE)
 
 
 class RunCommand(Command):
@@ -57,6 +56,8 @@ class RunCommand(Command):
         parser.add_argument("-v", "--verbose", action="store_true", help="Print verbose output.")
 
     def handle(self, args):
+        from piehook.hooks import hooks
+
         suffix = args.suffix or '_hooks'
         hooks.set_verbose(args.verbose)
         hooks.import_hooks(root_path=args.path, file_suffix=suffix)
@@ -75,6 +76,8 @@ class CLI:
     """
 
     def __init__(self, description):
+        import argparse
+
         self.parser = argparse.ArgumentParser(description=description)
         self.subparsers = self.parser.add_subparsers(dest="command", help="Sub-command help")
         self.commands = {}
@@ -83,22 +86,39 @@ class CLI:
         """
         Adds a sub-command to the CLI.
 
+        The sub-command's arguments are not registered until it is selected in `run`.
+
         Args:
         - command (Command): A Command object representing the sub-command to be added.
         """
-        parser = self.subparsers.add_parser(command.name, help=command.help)
-        command.add_arguments(parser)
-        parser.set_defaults(func=command.handle)
         self.commands[command.name] = command
 
     def run(self):
         """
         Parses command-line arguments and executes the corresponding sub-command.
         """
-        args = self.parser.parse_args()
+        import argparse
+        import sys
+
+        # Register bare sub-parsers first so only the selected command pays for add_arguments.
+        parsers = {
+            name: self.subparsers.add_parser(name, help=command.help, add_help=False)
+            for name, command in self.commands.items()
+        }
+
+        args, _ = self.parser.parse_known_args()
         if args.command is None:
             self.parser.print_help()
             sys.exit(1)
+
+        command = self.commands[args.command]
+        parser = parsers[args.command]
+        parser.add_argument("-h", "--help", action="help", default=argparse.SUPPRESS,
+                            help="show this help message and exit")
+        command.add_arguments(parser)
+        parser.set_defaults(func=command.handle)
+
+        args = self.parser.parse_args()
         args.func(args)
 
 
@@ -1,17 +1,97 @@
-import heapq
+import bisect
+import functools
 import importlib
 import os
 import sys
+import threading
 import logging
+import weakref
 
 from collections import defaultdict
 
+# Directories never searched for hook files, in addition to hidden (dot) directories.
+_SKIP_DIRS = frozenset(('__pycache__', 'node_modules', 'venv', 'site-packages'))
+
+
+def _configure_logger():
+    """
+    Attach the piehook stream handler once, however many HookManagers are created.
+    """
+    logger = logging.getLogger('piehook')
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        handler.setFormatter(formatter)
+        logger.addHandler(handler)
+        logger.propagate = False
+    return logger
+
+
+def _new_event_loop():
+    """
+    Create an event loop for running async hooks.
+    """
+    import asyncio
+
+    loop = asyncio.new_event_loop()
+    # Eager tasks (Python 3.12+) run synchronously until their first suspension.
+    eager_task_factory = getattr(asyncio, 'eager_task_factory', None)
+    if eager_task_factory is not None:
+        loop.set_task_factory(eager_task_factory)
+    return loop
+
+
+def _cancel_all_tasks(loop):
+    """
+    Cancel the tasks still pending on a loop and wait for them to finish.
+    """
+    import asyncio
+
+    tasks = asyncio.all_tasks(loop)
+    if not tasks:
+        return
+    for task in tasks:
+        task.cancel()
+    loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+
+
+def _close_event_loop(loop):
+    """
+    Shut down and close a loop created by `_new_event_loop`, the way `asyncio.run` does.
+    """
+    if loop.is_closed() or loop.is_running():
+        return
+    try:
+        _cancel_all_tasks(loop)
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        # shutdown_default_executor was added in Python 3.9.
+        shutdown_default_executor = getattr(loop, 'shutdown_default_executor', None)
+        if shutdown_default_executor is not None:
+            loop.run_until_complete(shutdown_default_executor())
+    finally:
+        loop.close()
+
+
+def _is_hashable(func):
+    """
+    Return True if the hook can be used as a key in the remove() index.
+    """
+    try:
+        hash(func)
+    except TypeError:
+        return False
+    return True
+
 
 class HookManager:
     """
     A manager for hooks in a Python application.
     """
 
+    __slots__ = ('imported_hooks', '_hooks', '_async_hooks', '_sorted_funcs', '_sorted_async',
+                 '_func_index', '_index', '_loop', '_loop_finalizer', 'logger',
+                 '__weakref__')
+
     def __init__(self, verbose=False):
         """
         Initialize the HookManager.
@@ -21,19 +101,18 @@ class HookManager:
         """
         self.imported_hooks = set()
         self._hooks = defaultdict(list)
+        self._async_hooks = defaultdict(list)
+        # Per-id tuples of hook functions in run order, built on the first run of an id and
+        # dropped by add()/remove() whenever that id's hooks change.
+        self._sorted_funcs = {}
+        self._sorted_async = {}
+        self._func_index = {}
         self._index = 0
+        self._loop = None
+        self._loop_finalizer = None
 
-        # Setup logging
-        self.logger = logging.getLogger('piehook')
-        self.logger.setLevel(logging.INFO if not verbose else logging.DEBUG)
-
-        handler = logging.StreamHandler()
-        handler.setLevel(logging.INFO if not verbose else logging.DEBUG)
-
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        handler.setFormatter(formatter)
-
-        self.logger.addHandler(handler)
+        self.logger = _configure_logger()
+        self.set_verbose(verbose)
 
     def set_verbose(self, verbose):
         """
@@ -42,38 +121,232 @@ class HookManager:
         Args:
             verbose (bool): If True, set the logging level to DEBUG, otherwise set to INFO.
         """
+        # The piehook handler has no level of its own, so the logger level is all that changes.
         self.logger.setLevel(logging.INFO if not verbose else logging.DEBUG)
-        handler = self.logger.handlers[0]
-        handler.setLevel(logging.INFO if not verbose else logging.DEBUG)
 
-    def run(self, id, *args, **kwargs):
+    def run(self, id, *args, parallel=False, **kwargs):
         """
         Run all hooks associated with the given id.
 
+        Synchronous hooks are run first, in priority order. Async hooks are then started
+        in priority order and awaited together on an event loop owned by this manager. The
+        main thread reuses one loop; other threads get a new loop that is closed afterwards.
+        From inside a running event loop, await `arun` instead.
+
+        Args:
+            id (str): The identifier for the hooks to be run.
+            *args: Positional arguments to be passed to the hooks.
+            parallel (bool): If True, run synchronous hooks in the loop's default executor
+                alongside the async hooks instead of one after another. Hooks may then
+                finish in any order.
+            **kwargs: Keyword arguments to be passed to the hooks.
+        """
+        # Most ids have zero or one hook; handle those without the general machinery.
+        sync_entries = self._hooks.get(id)
+        async_entries = self._async_hooks.get(id)
+        if not sync_entries and not async_entries:
+            return
+        if not async_entries and len(sync_entries) == 1:
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("Running %d hooks for %s", 1, id)
+            sync_entries[0][2](*args, **kwargs)
+            return
+
+        funcs, async_funcs = self._prepare(id)
+
+        if async_funcs or (parallel and funcs):
+            import asyncio
+
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                pass
+            else:
+                raise RuntimeError(
+                    f"Cannot run async hooks for {id!r} inside a running event loop; await arun() instead"
+                )
+
+        if parallel:
+            self._run_until_complete(self._run_parallel_hooks(funcs, async_funcs, *args, **kwargs))
+            return
+
+        for func in funcs:
+            func(*args, **kwargs)
+
+        if async_funcs:
+            self._run_until_complete(self._run_async_hooks(async_funcs, *args, **kwargs))
+
+    async def arun(self, id, *args, parallel=False, **kwargs):
+        """
+        Run all hooks associated with the given id on the current event loop.
+
+        Synchronous hooks are run inline first, in priority order, then async hooks are
+        awaited together.
+
         Args:
             id (str): The identifier for the hooks to be run.
             *args: Positional arguments to be passed to the hooks.
+            parallel (bool): If True, run synchronous hooks in the loop's default executor
+                alongside the async hooks instead of inline.
             **kwargs: Keyword arguments to be passed to the hooks.
         """
-        funcs = [func for _, _, func in sorted(self._hooks[id], reverse=True)]
-        self.logger.info(f"Running {len(funcs)} hooks for {id}")
+        funcs, async_funcs = self._prepare(id)
+
+        if parallel:
+            await self._run_parallel_hooks(funcs, async_funcs, *args, **kwargs)
+            return
 
         for func in funcs:
             func(*args, **kwargs)
 
+        if async_funcs:
+            await self._run_async_hooks(async_funcs, *args, **kwargs)
+
+    def _prepare(self, id):
+        """
+        Return the sorted (sync, async) hook functions for the given id and log the run.
+
+        Args:
+            id (str): The identifier for the hooks to be run.
+        """
+        funcs = self._sorted(self._hooks, self._sorted_funcs, id)
+        async_funcs = self._sorted(self._async_hooks, self._sorted_async, id)
+
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Running %d hooks for %s", len(funcs) + len(async_funcs), id)
+        return funcs, async_funcs
+
+    def close(self):
+        """
+        Close the event loop that `run` keeps for the main thread.
+
+        This also happens automatically when the manager is garbage collected or the
+        interpreter exits. `run` creates a new loop if used afterwards.
+        """
+        finalizer = self._loop_finalizer
+        self._loop = self._loop_finalizer = None
+        if finalizer is not None:
+            finalizer()
+
+    def _run_until_complete(self, coro):
+        """
+        Run the coroutine to completion on an event loop for the calling thread.
+
+        Only the main thread reuses a cached loop. Other threads may be short-lived, so
+        they get a new loop that is shut down and closed again, as `asyncio.run` does.
+        Either way no tasks are left pending, e.g. the siblings of a hook that raised.
+        """
+        if threading.current_thread() is not threading.main_thread():
+            loop = _new_event_loop()
+            try:
+                return loop.run_until_complete(coro)
+            finally:
+                _close_event_loop(loop)
+        loop = self._get_loop()
+        try:
+            return loop.run_until_complete(coro)
+        finally:
+            # Otherwise leftover tasks would resume inside the next, unrelated run().
+            _cancel_all_tasks(loop)
+
+    def _get_loop(self):
+        """
+        Return the main thread's event loop used by `run`, creating it on first use.
+
+        The loop is reused across calls so `run` does not set up a new loop each time.
+        """
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            if self._loop_finalizer is not None:
+                self._loop_finalizer.detach()
+            loop = _new_event_loop()
+            self._loop = loop
+            # Closes the loop on garbage collection or at exit without keeping the manager alive.
+            self._loop_finalizer = weakref.finalize(self, _close_event_loop, loop)
+        return loop
+
+    async def _run_async_hooks(self, hooks, *args, **kwargs):
+        """
+        Await the given async hooks concurrently.
+
+        Args:
+            hooks (tuple): The async hook functions, in priority order.
+            *args: Positional arguments to be passed to the hooks.
+            **kwargs: Keyword arguments to be passed to the hooks.
+        """
+        import asyncio
+
+        await asyncio.gather(*(hook(*args, **kwargs) for hook in hooks))
+
+    async def _run_parallel_hooks(self, funcs, async_funcs, *args, **kwargs):
+        """
+        Await sync hooks in the default executor together with the async hooks.
+
+        Args:
+            funcs (tuple): The synchronous hook functions, in priority order.
+            async_funcs (tuple): The async hook functions, in priority order.
+            *args: Positional arguments to be passed to the hooks.
+            **kwargs: Keyword arguments to be passed to the hooks.
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *(loop.run_in_executor(None, functools.partial(func, *args, **kwargs)) for func in funcs),
+            *(hook(*args, **kwargs) for hook in async_funcs),
+        )
+
+    def _sorted(self, hooks, cache, id):
+        """
+        Return the hook functions for the given id in run order, caching the result.
+
+        Args:
+            hooks (dict): The registry to read from (sync or async hooks).
+            cache (dict): The sorted-function cache belonging to that registry.
+            id (str): The identifier for the hooks.
+        """
+        funcs = cache.get(id)
+        if funcs is None:
+            entries = hooks.get(id)
+            if not entries:
+                return ()
+            funcs = tuple(func for _, _, func in entries)
+            cache[id] = funcs
+        return funcs
+
+    def _registry(self, func):
+        """
+        Return the (hooks, cache) pair that the given function belongs in.
+        """
+        import inspect
+
+        if inspect.iscoroutinefunction(func):
+            return self._async_hooks, self._sorted_async
+        return self._hooks, self._sorted_funcs
+
     def add(self, id, priority=0):
         """
         Add a hook with the given id and priority.
 
+        Coroutine functions are registered as async hooks.
+
         Args:
             id (str): The identifier for the hook.
-            priority (int): The priority of the hook. Hooks with lower priority values are run first.
+            priority (int): The priority of the hook. Hooks with higher priority values are run first.
 
         Returns:
             function: A decorator that adds the decorated function as a hook.
         """
         def decorator(func):
-            heapq.heappush(self._hooks[id], (priority, self._index, func))
+            hooks, cache = self._registry(func)
+            # Negated keys keep the list in run order: highest priority first, and the most
+            # recently added first among equal priorities. The index is unique, so the
+            # functions themselves are never compared.
+            entry = (-priority, -self._index, func)
+            bisect.insort(hooks[id], entry)
+            if _is_hashable(func):
+                self._func_index.setdefault(id, {}).setdefault(func, []).append(entry)
+            cache.pop(id, None)
             self._index += 1
             return func
         return decorator
@@ -86,7 +359,26 @@ class HookManager:
             id (str): The identifier for the hook.
             func (function): The function to be removed as a hook.
         """
-        self._hooks[id] = [hook for hook in self._hooks[id] if hook[2] != func]
+        hooks, cache = self._registry(func)
+        if _is_hashable(func):
+            index = self._func_index.get(id)
+            removed = index.pop(func, None) if index else None
+            if index is not None and not index:
+                del self._func_index[id]
+        else:
+            # Unhashable hooks are not indexed, so find them by equality.
+            removed = [entry for entry in hooks.get(id, ()) if entry[2] == func]
+        if not removed:
+            return
+
+        entries = hooks[id]
+        for entry in removed:
+            i = bisect.bisect_left(entries, entry)
+            if i < len(entries) and entries[i] is entry:
+                del entries[i]
+        if not entries:
+            del hooks[id]
+        cache.pop(id, None)
 
     def import_hooks(self, root_path=None, file_suffix='_hooks'):
         """
@@ -100,16 +392,53 @@ class HookManager:
             main_module = sys.modules['__main__']
             root_path = os.path.dirname(os.path.abspath(main_module.__file__))
 
-        for root, dirs, files in os.walk(root_path):
-            for file in files:
-                if file.endswith(f'{file_suffix}.py'):
-                    mod_name = os.path.relpath(os.path.join(root, file), root_path).replace(os.sep, '.')[:-3]
-                    old_hook_count = len(self.imported_hooks)
-                    if mod_name not in self.imported_hooks:
-                        importlib.import_module(mod_name)
-                        self.imported_hooks.add(mod_name)
-                        new_hook_count = len(self.imported_hooks)
-                        self.logger.info(f"Imported {new_hook_count - old_hook_count} hook(s) from {mod_name}")
+        suffix_py = f'{file_suffix}.py'
+
+        def _walk(path):
+            # DirEntry caches its stat result, so this avoids the extra syscalls of os.walk.
+            # Symlinked directories are not followed and unreadable ones are skipped,
+            # matching os.walk's defaults.
+            try:
+                it = os.scandir(path)
+            except OSError:
+                return
+            # Like os.walk, yield a directory's files before descending into its
+            # subdirectories, so parent hooks are imported (and indexed) first.
+            subdirs = []
+            with it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not entry.name.startswith('.') and entry.name not in _SKIP_DIRS:
+                            subdirs.append(entry.path)
+                    elif entry.name.endswith(suffix_py):
+                        yield entry
+            for subdir in subdirs:
+                yield from _walk(subdir)
+
+        # Entry paths all start with root_path plus a separator, so slicing replaces relpath.
+        root_prefix_len = len(os.path.join(root_path, ''))
+        modules = sys.modules
+        for entry in _walk(root_path):
+            mod_name = entry.path[root_prefix_len:-3].replace(os.sep, '.')
+            if mod_name in self.imported_hooks:
+                continue
+            # Modules imported elsewhere have already registered their hooks.
+            if mod_name in modules:
+                self.imported_hooks.add(mod_name)
+                continue
+            old_hook_count = len(self.imported_hooks)
+            importlib.import_module(mod_name)
+            self.imported_hooks.add(mod_name)
+            new_hook_count = len(self.imported_hooks)
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("Imported %d hook(s) from %s", new_hook_count - old_hook_count, mod_name)
 
 
-hooks = HookManager()
\ No newline at end of file
+def __getattr__(name):
+    # Build the shared HookManager on first access (PEP 562) so importing
+    # this module does not pay for logger setup until hooks are needed.
+    if name == 'hooks':
+        global hooks
+        hooks = HookManager()
+        return hooks
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -11,5 +11,5 @@ setup(
             'piehook = piehook.cli:main'
         ]
     },
-    python_requires='>=3.6',
+    python_requires='>=3.7',
 )
\ No newline at end of file
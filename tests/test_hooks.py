@@ -0,0 +1,217 @@
+import asyncio
+import logging
+import os
+import tempfile
+import threading
+import unittest
+
+from dataclasses import dataclass
+from unittest import mock
+
+from piehook.hooks import HookManager
+
+
+@dataclass
+class CallableHook:
+    """A callable that defines __eq__ without __hash__, so it is unhashable."""
+    name: str
+    calls: list
+
+    def __call__(self):
+        self.calls.append(self.name)
+
+
+class HookManagerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.hooks = HookManager()
+        self.hooks.logger.setLevel(logging.WARNING)
+        self.calls = []
+
+    def tearDown(self):
+        self.hooks.close()
+
+    def record(self, name):
+        def hook(*args, **kwargs):
+            self.calls.append(name)
+        return hook
+
+    def record_async(self, name):
+        async def hook(*args, **kwargs):
+            await asyncio.sleep(0)
+            self.calls.append(name)
+        return hook
+
+
+class TestOrdering(HookManagerTestCase):
+    def test_higher_priority_runs_first(self):
+        self.hooks.add('e')(self.record('low'))
+        self.hooks.add('e', priority=20)(self.record('high'))
+        self.hooks.add('e', priority=5)(self.record('mid'))
+        self.hooks.run('e')
+        self.assertEqual(self.calls, ['high', 'mid', 'low'])
+
+    def test_latest_hook_runs_first_among_equal_priorities(self):
+        self.hooks.add('e')(self.record('first'))
+        self.hooks.add('e')(self.record('second'))
+        self.hooks.run('e')
+        self.assertEqual(self.calls, ['second', 'first'])
+
+    def test_any_numeric_priority_is_accepted(self):
+        self.hooks.add('e', priority=1.5)(self.record('float'))
+        self.hooks.add('e', priority=100000)(self.record('large'))
+        self.hooks.add('e', priority=-100000)(self.record('negative'))
+        self.hooks.run('e')
+        self.assertEqual(self.calls, ['large', 'float', 'negative'])
+
+    def test_sync_hooks_run_before_async_hooks(self):
+        self.hooks.add('e', priority=10)(self.record_async('async'))
+        self.hooks.add('e')(self.record('sync'))
+        self.hooks.run('e')
+        self.assertEqual(self.calls, ['sync', 'async'])
+
+    def test_arun_runs_sync_then_async_hooks(self):
+        self.hooks.add('e', priority=10)(self.record_async('async'))
+        self.hooks.add('e')(self.record('sync'))
+        asyncio.run(self.hooks.arun('e'))
+        self.assertEqual(self.calls, ['sync', 'async'])
+
+    def test_unknown_id_is_a_no_op(self):
+        self.hooks.run('missing')
+        self.assertNotIn('missing', self.hooks._hooks)
+
+
+class TestRemove(HookManagerTestCase):
+    def test_remove_hashable_hook(self):
+        keep, drop = self.record('keep'), self.record('drop')
+        self.hooks.add('e')(keep)
+        self.hooks.add('e')(drop)
+        self.hooks.remove('e', drop)
+        self.hooks.run('e')
+        self.assertEqual(self.calls, ['keep'])
+
+    def test_remove_bound_method(self):
+        class Listener:
+            def on_event(inner):
+                self.calls.append('method')
+
+        listener = Listener()
+        self.hooks.add('e')(listener.on_event)
+        self.hooks.remove('e', listener.on_event)
+        self.hooks.run('e')
+        self.assertEqual(self.calls, [])
+
+    def test_remove_unhashable_hook(self):
+        self.hooks.add('e')(CallableHook('keep', self.calls))
+        self.hooks.add('e')(CallableHook('drop', self.calls))
+        self.hooks.remove('e', CallableHook('drop', self.calls))
+        self.hooks.run('e')
+        self.assertEqual(self.calls, ['keep'])
+
+    def test_remove_async_hook(self):
+        hook = self.record_async('async')
+        self.hooks.add('e')(hook)
+        self.hooks.remove('e', hook)
+        self.hooks.run('e')
+        self.assertEqual(self.calls, [])
+        self.assertFalse(self.hooks._async_hooks)
+
+
+class TestAsync(HookManagerTestCase):
+    def test_run_inside_running_loop_raises(self):
+        self.hooks.add('e')(self.record('sync'))
+        self.hooks.add('e')(self.record_async('async'))
+
+        async def main():
+            self.hooks.run('e')
+
+        with self.assertRaises(RuntimeError):
+            asyncio.run(main())
+        self.assertEqual(self.calls, [])
+
+    def test_parallel_runs_sync_hooks_in_executor(self):
+        threads = []
+        self.hooks.add('e')(lambda: threads.append(threading.current_thread()))
+        self.hooks.add('e')(self.record_async('async'))
+        self.hooks.run('e', parallel=True)
+        self.assertEqual(self.calls, ['async'])
+        self.assertEqual(len(threads), 1)
+        self.assertIsNot(threads[0], threading.current_thread())
+
+
+    def test_main_thread_reuses_loop_until_closed(self):
+        loops = []
+
+        async def hook():
+            loops.append(asyncio.get_running_loop())
+
+        self.hooks.add('e')(hook)
+        self.hooks.run('e')
+        self.hooks.run('e')
+        self.assertIs(loops[0], loops[1])
+        self.hooks.close()
+        self.assertTrue(loops[0].is_closed())
+
+    def test_other_threads_close_their_loops(self):
+        loops = []
+
+        async def hook():
+            loops.append(asyncio.get_running_loop())
+
+        self.hooks.add('e')(hook)
+        for _ in range(3):
+            thread = threading.Thread(target=self.hooks.run, args=('e',))
+            thread.start()
+            thread.join()
+        self.assertEqual(len(loops), 3)
+        self.assertTrue(all(loop.is_closed() for loop in loops))
+        self.assertIsNone(self.hooks._loop)
+
+
+    def test_failing_hook_does_not_leave_sibling_tasks_pending(self):
+        async def fails():
+            raise ValueError('boom')
+
+        async def slow():
+            try:
+                await asyncio.sleep(0.05)
+                self.calls.append('slow finished')
+            except asyncio.CancelledError:
+                self.calls.append('slow cancelled')
+                raise
+
+        self.hooks.add('e', priority=1)(fails)
+        self.hooks.add('e')(slow)
+        self.hooks.add('other')(self.record_async('other'))
+        self.hooks.add('other')(self.record_async('other 2'))
+
+        with self.assertRaises(ValueError):
+            self.hooks.run('e')
+        self.assertEqual(self.calls, ['slow cancelled'])
+        self.assertFalse(asyncio.all_tasks(self.hooks._loop))
+
+        self.hooks.run('other')
+        self.assertNotIn('slow finished', self.calls)
+
+
+class TestImportHooks(HookManagerTestCase):
+    def test_parent_directory_hooks_are_imported_before_subdirectories(self):
+        with tempfile.TemporaryDirectory() as root:
+            for name in ('aaa', 'zzz'):
+                os.makedirs(os.path.join(root, name, 'deeper'))
+                open(os.path.join(root, name, 'deeper', 'c_hooks.py'), 'w').close()
+                open(os.path.join(root, name, 'b_hooks.py'), 'w').close()
+            open(os.path.join(root, 'a_hooks.py'), 'w').close()
+            open(os.path.join(root, 'z_hooks.py'), 'w').close()
+
+            with mock.patch('importlib.import_module') as import_module:
+                self.hooks.import_hooks(root_path=root)
+
+        imported = [call[0][0] for call in import_module.call_args_list]
+        self.assertEqual(len(imported), 6)
+        self.assertEqual(set(imported[:2]), {'a_hooks', 'z_hooks'})
+        for name in ('aaa', 'zzz'):
+            self.assertLess(imported.index(f'{name}.b_hooks'), imported.index(f'{name}.deeper.c_hooks'))
+
+
+if __name__ == '__main__':
+    unittest.main()